@@ -1,11 +1,12 @@
 import argparse
-import csv
 import os
 import sys
+
+import pandas as pd
 from __VERSION__ import __VERSION__
-import dicomorganizer.log_config as log_config
+import dicomorganizer.apps.cli.dicomorganizer.log_config as log_config
 from dicomorganizer import DicomManager
-from pydicom.datadict import tag_for_keyword, keyword_for_tag
+from pydicom.datadict import tag_for_keyword
 
 
 def main():
@@ -84,7 +85,7 @@ def main():
         sys.exit(1)
     
     # Check that identifier list file exists
-    if not os.path.exists(identifier_list_csv) and identifier_list_csv is not None:
+    if identifier_list_csv is not None and not os.path.exists(identifier_list_csv):
         logger.error(f"Identifier list file '{identifier_list_csv}' does not exist.")
         sys.exit(1)
     
@@ -103,12 +104,16 @@ def main():
     # Start the anonymization process
     logger.info("Starting anonymization process...")
     
-    # load the identifiers
-    identifiers = {}
-    with open(identifier_list_csv, 'r') as f:
-        reader = csv.reader(f, delimiter=";")
-        for row in reader:
-            identifiers[row[0]] = row[1]
+    # load the identifiers; pandas' C tokenizer parses the whole file in one
+    # pass instead of a Python-level loop over csv.reader rows
+    identifiers = None
+    if identifier_list_csv is not None:
+        identifiers = (
+            pd.read_csv(identifier_list_csv, sep=";", header=None,
+                        names=["patient_id", "anonymized_id"], dtype=str, engine="c")
+            .set_index("patient_id")["anonymized_id"]
+            .to_dict()
+        )
     
     drop_tags = []
     with open(drop_tags_txt, 'r') as f:
@@ -117,7 +122,10 @@ def main():
     processed_drop_tags = []
     for tag in drop_tags:
         try:
-            processed_tag = keyword_for_tag(tag) if keyword_for_tag(tag) is not None else int(tag, 16)
+            # Resolve keyword entries (e.g. 'PatientBirthDate') to their numeric
+            # tag, falling back to parsing hex entries (e.g. '00100030').
+            kw_tag = tag_for_keyword(tag)
+            processed_tag = kw_tag if kw_tag is not None else int(tag, 16)
             processed_drop_tags.append(processed_tag)
         except Exception as e:
             logger.error(f"Error processing drop tag '{tag}': {e}")
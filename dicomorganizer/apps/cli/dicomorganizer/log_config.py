@@ -52,7 +52,51 @@ def set_logging():
     return logger
 
 
-def set_file_logging(log_directory=None):    
+_CONFIGURED_LOGGER = None
+
+
+def setup_logging(log_dir=None):
+    """
+    Configures root logging with a timestamped file handler and a stdout handler.
+
+    Args:
+        log_dir (str, optional): Directory to write log files to. When provided,
+            it is used as-is; otherwise a 'logs' directory is created next to the
+            running script (or executable when frozen).
+
+    Returns:
+        logging.Logger: The configured root logger. Repeated calls return the
+        already-configured logger without recomputing paths or adding handlers.
+    """
+    global _CONFIGURED_LOGGER
+    if _CONFIGURED_LOGGER is not None:
+        return _CONFIGURED_LOGGER
+
+    if log_dir is None:
+        if getattr(sys, 'frozen', False):  # Check if the app is run as a frozen executable
+            log_dir = os.path.dirname(sys.executable)
+        else:
+            log_dir = os.path.dirname(sys.argv[0])
+        log_dir = os.path.join(log_dir, "logs")
+    os.makedirs(log_dir, exist_ok=True)
+
+    # Create a timestamped filename
+    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    log_filename = os.path.join(log_dir, f"{timestamp}.log")
+
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(name)s - %(module)s.%(funcName)s:%(lineno)d - %(message)s')
+    logger = logging.getLogger()
+    for handler in (logging.FileHandler(log_filename), logging.StreamHandler(sys.stdout)):
+        handler.setLevel(logging.INFO)
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+
+    _CONFIGURED_LOGGER = logger
+    return logger
+
+
+def set_file_logging(log_directory=None):
     if log_directory is None:
         if getattr(sys, 'frozen', False):  # Check if the app is run as a frozen executable
             log_directory = os.path.dirname(sys.executable)  # Get the directory of the executable
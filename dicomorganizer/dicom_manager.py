@@ -1,19 +1,169 @@
+import collections
+import concurrent.futures
+import functools
+import itertools
 import json
 import logging
+import mmap
+import multiprocessing
 import os
 from pathlib import Path
+import queue
 import re
 import shutil
 import sqlite3
+import sys
+import threading
 import numpy as np
 import pandas as pd
 import pydicom
 import pickle
 from dicomorganizer.utils import create_dicommanager_filter, extract_format, parallel_tasks, validate_filters
+from pydicom.datadict import tag_for_keyword
 from pydicom.multival import MultiValue
+from pydicom.tag import Tag
 
 logger = logging.getLogger(__name__)
 
+
+def _resolve_tag(tag):
+    """
+    Resolves a DICOM keyword or numeric tag to a pydicom Tag.
+
+    Args:
+        tag (str or int): A DICOM keyword (e.g. 'PatientID') or numeric tag.
+
+    Returns:
+        pydicom.tag.Tag: The resolved numeric tag.
+
+    Raises:
+        ValueError: If a keyword is not a known DICOM keyword.
+    """
+    if isinstance(tag, str):
+        tag_id = tag_for_keyword(tag)
+        if tag_id is None:
+            raise ValueError(f"'{tag}' is not a valid DICOM keyword.")
+        return Tag(tag_id)
+    return Tag(tag)
+
+
+def _has_dicm_magic(filepath):
+    """
+    Checks for the 'DICM' magic bytes at offset 128 without parsing the file.
+
+    DICOM part-10 files carry a 128-byte preamble followed by 'DICM'; mapping
+    just those bytes touches a single page, which is far cheaper than letting
+    pydicom read file-meta before raising InvalidDicomError on JPEG previews,
+    readmes and other PACS sidecar files.
+
+    Args:
+        filepath (str): Path to the file to check.
+
+    Returns:
+        bool: True if the file starts with a DICOM preamble and magic bytes.
+    """
+    try:
+        with open(filepath, "rb") as f:
+            if os.fstat(f.fileno()).st_size < 132:
+                return False
+            with mmap.mmap(f.fileno(), 132, access=mmap.ACCESS_READ) as mm:
+                return mm[128:132] == b"DICM"
+    except OSError:
+        return False
+
+
+# The two spellings seen in practice; an exact frozenset probe avoids the
+# per-entry str.upper() allocation on the millions of names that are neither.
+_EXCLUDED_NAMES = frozenset({"DICOMDIR", "dicomdir"})
+
+
+def _is_excluded_name(name):
+    # Length gate keeps the upper() fallback (mixed-case spellings) off the
+    # hot path entirely.
+    return name in _EXCLUDED_NAMES or (len(name) == 8 and name.upper() == "DICOMDIR")
+
+
+def _iter_dicom_files(root):
+    """
+    Lazily walks `root` with an explicit stack of `os.scandir` calls.
+
+    `DirEntry` caches the file type from the directory read, so no extra
+    `stat()` call is issued per entry, which dominates traversal time on
+    large or network-mounted trees.
+
+    Args:
+        root (str): Directory to walk recursively.
+
+    Yields:
+        str: File paths, excluding any file named 'DICOMDIR' (case-insensitive).
+    """
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False) and not _is_excluded_name(entry.name):
+                        yield entry.path
+        except OSError as e:
+            # Skip unreadable directories instead of aborting the crawl,
+            # matching the parallel scanner's behavior.
+            logger.error(f"Failed to scan {directory}:\n => {e}")
+
+
+def _scan_directory_parallel(root, num_workers):
+    """
+    Recursively collects file paths under `root` using multiple scanner threads.
+
+    On network filesystems the crawl is latency-bound (one directory read
+    roundtrip at a time); threads keep several os.scandir calls in flight
+    concurrently (scandir releases the GIL), hiding that latency.
+
+    Args:
+        root (str): Directory to scan recursively.
+        num_workers (int): Number of scanner threads.
+
+    Returns:
+        collections.deque: File paths found, excluding 'DICOMDIR' (case-insensitive).
+    """
+    pending = queue.Queue()
+    pending.put(str(root))
+    found = collections.deque()
+
+    def _scan_worker():
+        while True:
+            directory = pending.get()
+            if directory is None:
+                break
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.put(entry.path)
+                        elif entry.is_file(follow_symlinks=False) and not _is_excluded_name(entry.name):
+                            found.append(entry.path)
+            except OSError as e:
+                logger.error(f"Failed to scan {directory}:\n => {e}")
+            finally:
+                pending.task_done()
+
+    threads = [threading.Thread(target=_scan_worker, daemon=True) for _ in range(num_workers)]
+    for thread in threads:
+        thread.start()
+
+    # All queued directories processed (task_done per get) means the scan is
+    # complete; unblock the workers with one sentinel each.
+    pending.join()
+    for _ in threads:
+        pending.put(None)
+    for thread in threads:
+        thread.join()
+
+    return found
+
+
 class DicomManager:
     """
     A class to manage DICOM files, extract metadata, and handle operations on them.
@@ -32,12 +182,21 @@ class DicomManager:
     ]
     
     CLEAR_TAGS = [
-        "PatientBirthDate", "PatientAge", "InstitutionName", 
-        "StationName", "StudyID", "AccessionNumber", 
+        "PatientBirthDate", "PatientAge", "InstitutionName",
+        "StationName", "StudyID", "AccessionNumber",
         "SeriesDescription", "StudyDescription"
     ]
 
-    def __init__(self, directory, tags=None, group_by=None, num_workers=None, *args, **kwargs):
+    # Low-cardinality string tags stored as pandas 'category' dtype: one code
+    # per unique value instead of one Python str object per row.
+    CATEGORICAL_TAGS = [
+        "Modality", "BurnedInAnnotation", "SOPClassUID", "StudyID", "Manufacturer",
+    ]
+
+    # Files per metadata-read chunk; each chunk becomes one partial DataFrame.
+    INFO_CHUNK_SIZE = 50_000
+
+    def __init__(self, directory, tags=None, group_by=None, num_workers=None, mp_start_method=None, *args, **kwargs):
         """
         Initializes the DicomManager class, which is used to manage DICOM files, 
         extract metadata, and handle operations such as filtering and anonymization.
@@ -62,7 +221,16 @@ class DicomManager:
                 The number of threads (workers) to use for parallel processing when 
                 extracting DICOM metadata or performing tasks like anonymization. If 
                 not provided, processing will be done sequentially.
-            
+
+            mp_start_method (str, optional):
+                Multiprocessing start method for the anonymization worker pool
+                ('fork', 'forkserver' or 'spawn'). Defaults to 'forkserver'
+                where available. Note that forkserver (like spawn) re-imports
+                the main module, so scripts using parallel anonymization must
+                guard their entry point with `if __name__ == "__main__":`;
+                pass 'fork' for guard-less scripts or interactive sessions on
+                POSIX.
+
             *args:
                 Additional positional arguments to pass to any methods that need them.
             
@@ -74,14 +242,76 @@ class DicomManager:
          
         self.directory = directory
         self.tags = tags or self.DEFAULT_DICOM_TAGS
+        # Resolve keywords to numeric tags once; passing these to dcmread and
+        # the extraction loop avoids a keyword lookup per tag per file.
+        self._tag_ids = tuple(_resolve_tag(tag) for tag in self.tags)
+        # Partition once: tags in group 0x0002 live in the file meta header. If
+        # no body tags are requested, reading can stop after the meta group.
+        self._body_tag_ids = tuple(tag for tag in self._tag_ids if tag.group != 0x0002)
+        self._meta_tags_only = not self._body_tag_ids and bool(self._tag_ids)
         self.num_workers = num_workers
+        self.mp_start_method = mp_start_method
         self.group_by = group_by
         self.args = args
         self.kwargs = kwargs
         self._df_dicom = None  # Lazy-loaded DataFrame to store DICOM metadata.
-        
-        
-        
+        self._dicom_paths = None  # Cached file paths from the last full crawl.
+        self._executor = None  # Cached process pool, created on first parallel use.
+
+
+
+    def _get_executor(self, num_workers):
+        """
+        Returns a cached ProcessPoolExecutor, creating it on first use.
+
+        Worker processes are expensive to start; reusing one pool across calls
+        (e.g. repeated anonymize_dicom runs) pays that cost once. Unless
+        overridden via `mp_start_method`, the forkserver start method is used
+        where available, so workers start from a small clean process instead
+        of forking the full parent (with its DataFrame and module-level
+        caches) or re-importing everything per pool like spawn does.
+
+        Forkserver and spawn re-import the main module, so callers must be
+        importable: run under an `if __name__ == "__main__":` guard, or
+        construct the manager with mp_start_method='fork' in guard-less
+        scripts and interactive sessions (POSIX only).
+
+        Args:
+            num_workers (int): Number of worker processes for the pool. A
+                cached pool of a different size is shut down and replaced.
+
+        Returns:
+            concurrent.futures.ProcessPoolExecutor: The cached executor.
+        """
+        if self._executor is not None and self._executor._max_workers != num_workers:
+            self._executor.shutdown()
+            self._executor = None
+        if self._executor is None:
+            method = self.mp_start_method
+            if method is None and "forkserver" in multiprocessing.get_all_start_methods():
+                method = "forkserver"
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=num_workers, mp_context=multiprocessing.get_context(method))
+        return self._executor
+
+    def close(self):
+        """Shuts down the cached worker pool, if any. Safe to call repeatedly."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __getstate__(self):
+        # Executors hold live processes and cannot be pickled (see save()).
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        return state
+
     @property
     def df_dicom(self):
         """
@@ -100,31 +330,58 @@ class DicomManager:
     
     def filter(self, filter_func, inplace=False):
         """
-        Filters the DICOM DataFrame based on a provided filter function.
-        
+        Filters the DICOM DataFrame based on a provided filter function or
+        a column→value mapping.
+
         Args:
-            filter_func (function): A function that takes a row of the DataFrame and returns a boolean value.
-        
+            filter_func (function or dict): Either a function that takes a row of
+                the DataFrame and returns a boolean value, or a dict mapping column
+                names to required values, e.g. {'Modality': 'CT'}. The dict form is
+                evaluated as vectorized column comparisons; the callable form runs
+                row-by-row in Python and is much slower on large catalogs.
+
             # Example filter function
             def filter_by_modality(row):
                 return row['Modality'] == 'CT'
-        
+
         Returns:
             pd.DataFrame: Filtered DataFrame containing only the rows for which the filter function returned True.
         """
-        if not callable(filter_func):
-            raise ValueError("The provided filter_func must be a callable function.")
-        
+        if not callable(filter_func) and not isinstance(filter_func, dict):
+            raise ValueError("The provided filter_func must be a callable function or a dict of column filters.")
+
         #first ungroup the DataFrame if it is grouped
         if isinstance(self.df_dicom, pd.core.groupby.DataFrameGroupBy):
             df = self._df_dicom.obj
         else:
             df = self._df_dicom
-            
-        # Apply the filter function to each row of the DataFrame
-        df_filtered = df[df.apply(filter_func, axis=1)]
-        
-        self._df_dicom = df_filtered.groupby(self.group_by) if self.group_by else df_filtered
+
+        if isinstance(filter_func, dict):
+            # C-level comparisons per column instead of a Python call per row.
+            # Values may be a scalar (equality), a list/set/tuple (isin), or a
+            # compiled regex (search), matching validate_filters output.
+            mask = np.ones(len(df), dtype=bool)
+            for column, value in filter_func.items():
+                if column not in df.columns:
+                    # Same behavior as the row-wise path: a missing key matches nothing
+                    mask[:] = False
+                    break
+                if isinstance(value, (list, set, tuple)):
+                    mask &= df[column].isin(value).values
+                elif hasattr(value, "search"):
+                    # map(search) rather than str.contains: contains warns on
+                    # patterns with match groups, which the canonical series
+                    # filters (e.g. '^sRLT_(66B|66|...)') all use.
+                    search = value.search
+                    mask &= df[column].astype(str).map(lambda s: search(s) is not None).values
+                else:
+                    mask &= (df[column].values == value)
+            df_filtered = df[mask]
+        else:
+            # Apply the filter function to each row of the DataFrame
+            df_filtered = df[df.apply(filter_func, axis=1)]
+
+        self._df_dicom = df_filtered.groupby(self.group_by, observed=True) if self.group_by else df_filtered
         return self._df_dicom
     
     
@@ -141,36 +398,51 @@ class DicomManager:
             list: A list of file paths of the anonymized DICOM files.
         """
         clear_tags = clear_tags or self.CLEAR_TAGS  # Use the class's CLEAR_TAGS if no custom tags are provided
-        
+        # Resolve keywords to numeric tags once so the per-file loop hits the
+        # integer-keyed fast path in pydicom instead of re-translating keywords.
+        clear_tags = [_resolve_tag(tag) for tag in clear_tags]
+
         assert os.path.exists(output_directory), f"Output directory '{output_directory}' does not exist."
         assert output_directory != self.directory, "Output directory cannot be the same as the input directory."
 
         # List to keep track of the anonymized files
         anonymized_files = []
         
-        #first ungroup the DataFrame if it is grouped
-        if isinstance(self.df_dicom, pd.core.groupby.DataFrameGroupBy):
-            df = self.df_dicom.obj
-        else:
-            df = self.df_dicom
-        
-        # Get all DICOM file paths from the self.df_dicom DataFrame
-        dicom_paths = df['filename'].tolist()
+        # Anonymization only needs file paths, not the metadata DataFrame
+        dicom_paths = self._filenames()
 
-        # Prepare arguments for parallel tasks
-        args_list = [(path, clear_tags, output_directory, identifiers) for path in dicom_paths]
-        
-        # Parallelize the anonymization task
-        if num_workers is None:
-            # Run sequentially if num_workers is not provided
-            for args in args_list:
-                result = self._anonymize_single_dicom(*args)
-                if result:
-                    anonymized_files.append(result)
-        else:
-            # Run in parallel if num_workers is specified
-            results = parallel_tasks(self._anonymize_single_dicom, args_list, num_workers, description="Anonymizing DICOM files")
-            anonymized_files.extend([r for r in results if r is not None])
+        # Bucket files by their containing directory: each worker then reads one
+        # directory as a linear stream (friendly to the OS prefetcher and NFS)
+        # and the per-task dispatch overhead is paid per directory, not per file.
+        buckets = collections.defaultdict(list)
+        for path in dicom_paths:
+            buckets[os.path.dirname(path)].append(path)
+
+        # Bind the invariant arguments once: the partial is pickled per chunk,
+        # so only the paths travel per task instead of re-serializing
+        # clear_tags/output_directory/identifiers for every batch.
+        task = functools.partial(
+            _anonymize_dicom_batch,
+            clear_tags=clear_tags,
+            output_directory=output_directory,
+            identifiers=identifiers,
+        )
+        args_list = [(paths,) for paths in buckets.values()]
+
+        # Parallelize the anonymization task; parallel_tasks runs inline when
+        # num_workers is None or 1. Batches are already directory-sized, so
+        # dispatch them one at a time. The process pool is cached on the
+        # manager so repeated calls reuse the same workers.
+        executor = self._get_executor(num_workers) if num_workers is not None and num_workers > 1 else None
+        results = parallel_tasks(task, args_list, num_workers, description="Anonymizing DICOM directories", chunksize=1, executor=executor)
+        for batch in results:
+            if batch:
+                anonymized_files.extend(result for result in batch if result is not None)
+
+        total = sum(len(paths) for paths in buckets.values())
+        failed = total - len(anonymized_files)
+        if failed:
+            logger.warning(f"Skipped or failed to anonymize {failed} of {total} file(s).")
 
         return anonymized_files
         
@@ -189,9 +461,25 @@ class DicomManager:
         """
     
         
-        dicom_info = self._get_dicom_info_parallel(self.tags, num_workers)
-        df_dicom = pd.DataFrame(dicom_info)
-        
+        # Workers return fixed-order tuples (see _get_single_dicom_info), so
+        # each chunk is assembled with from_records and an explicit column
+        # list, skipping pandas' column inference over per-row dicts entirely.
+        # Assembling per chunk bounds peak memory to one chunk of raw tuples
+        # plus the partial frames instead of the full tuple list.
+        columns = list(self.tags) + ["filename"]
+        frames = [pd.DataFrame.from_records(records, columns=columns)
+                  for records in self._get_dicom_info_parallel(self._tag_ids, num_workers)]
+        if not frames:
+            df_dicom = pd.DataFrame(columns=columns)
+        elif len(frames) == 1:
+            df_dicom = frames[0]
+        else:
+            df_dicom = pd.concat(frames, ignore_index=True)
+
+        for column in self.CATEGORICAL_TAGS:
+            if column in df_dicom.columns:
+                df_dicom[column] = df_dicom[column].astype("category")
+
         if group_by is not None:
             # Check if group_by columns are present in DICOM metadata
             group_by_list = group_by if isinstance(group_by, (list, tuple)) else list([group_by])
@@ -202,45 +490,102 @@ class DicomManager:
                         f"Group by '{error_message}' not found in DICOM metadata. Available columns: {df_dicom.columns}"
                     )
                 
-            return df_dicom.groupby(group_by)
-        
+            # observed=True keeps categorical group keys limited to values that
+            # actually occur instead of every category level.
+            return df_dicom.groupby(group_by, observed=True)
+
         return df_dicom
 
     def _get_dicom_info_parallel(self, tags, num_workers):
         """
-        Retrieves DICOM metadata from multiple files in parallel.
+        Retrieves DICOM metadata from multiple files in parallel, in chunks of
+        INFO_CHUNK_SIZE files.
 
         Args:
-            tags (list): List of DICOM tags to extract from each file.
+            tags (tuple): Pre-resolved numeric DICOM tags to extract from each file.
             num_workers (int): Number of threads to use for parallel processing. If None, processing is done sequentially.
 
+        Yields:
+            list[tuple]: Metadata tuples for one chunk of files, with skipped
+                files already dropped. Yields nothing if no files are found.
+        """
+        # Stream the crawl into the workers so reading overlaps with discovery
+        # instead of materializing the full path list up front. The paths are
+        # remembered as they stream so later calls (e.g. anonymize_dicom)
+        # don't crawl again.
+        args_iter = ((path, tags) for path in self._collect_paths(self._get_dicom_file_paths()))
+
+        while True:
+            # islice hands parallel_tasks a view of the next chunk without
+            # materializing it, so crawl/read overlap is kept within chunks.
+            chunk = itertools.islice(args_iter, self.INFO_CHUNK_SIZE)
+            # The metadata read is I/O-bound (specific_tags + stop_before_pixels
+            # keeps decoding minimal and pydicom's file reads release the GIL), so
+            # threads beat processes here: no pickling of tasks or results.
+            results = parallel_tasks(self._get_single_dicom_info, chunk, num_workers,
+                                     description="Reading DICOM files",
+                                     executor_cls=concurrent.futures.ThreadPoolExecutor)
+            # One result per task (possibly None), so an empty list means the
+            # crawl is exhausted.
+            if not results:
+                break
+            # Drop skipped files (None); result tuples are never empty, so
+            # filter(None, ...) is safe and runs at C level.
+            yield list(filter(None, results))
+
+    def _collect_paths(self, paths):
+        """
+        Passes `paths` through unchanged while recording them; the cache is
+        published to self._dicom_paths only once the crawl completed.
+
+        Args:
+            paths (iterable): Streaming file paths from a directory crawl.
+
+        Yields:
+            str: The same paths, unmodified.
+        """
+        collected = []
+        for path in paths:
+            collected.append(path)
+            yield path
+        self._dicom_paths = collected
+
+    def _filenames(self):
+        """
+        Returns the file paths of the managed DICOM files without forcing a
+        pandas DataFrame build.
+
+        When a metadata DataFrame has already been materialized (e.g. after
+        filtering), its filename column is authoritative; otherwise the paths
+        come straight from the directory crawl.
+
         Returns:
-            list[dict]: A list of dictionaries, each containing metadata for a single DICOM file. 
-                        Returns an empty list if no valid DICOM files are found.
+            iterable[str]: DICOM file paths.
         """
-        dicom_paths = self._get_dicom_file_paths()
-        args_list = [(path, tags) for path in dicom_paths]
-        
-        if num_workers is None:
-            result =  [self._get_single_dicom_info(*args) for args in args_list]
-            return [r for r in result if r is not None]
-        
-        results = parallel_tasks(self._get_single_dicom_info, args_list, num_workers, description="Reading DICOM files")
-        return [r for r in results if r is not None]
+        if self._df_dicom is not None:
+            #first ungroup the DataFrame if it is grouped
+            if isinstance(self._df_dicom, pd.core.groupby.DataFrameGroupBy):
+                return self._df_dicom.obj['filename'].tolist()
+            return self._df_dicom['filename'].tolist()
+        if self._dicom_paths is None:
+            self._dicom_paths = list(self._get_dicom_file_paths())
+        return self._dicom_paths
 
-    def _get_dicom_file_paths(self) -> list[str]:
+    def _get_dicom_file_paths(self):
         """
         Recursively collects all DICOM file paths from the specified directory (self.directory).
 
+        When multiple workers are configured, the crawl itself is parallelized
+        across scanner threads (see _scan_directory_parallel); otherwise a lazy
+        sequential walk is used.
+
         Returns:
-            list[str]: A list of file paths pointing to DICOM files in the directory,
-                    excluding any file named 'DICOMDIR' (case-insensitive).
+            iterable[str]: File paths pointing to DICOM files in the directory,
+                 excluding any file named 'DICOMDIR' (case-insensitive).
         """
-        return [
-            str(path)
-            for path in Path(self.directory).rglob("*")
-            if path.is_file() and path.name.upper() != "DICOMDIR"
-        ]
+        if self.num_workers is not None and self.num_workers > 1:
+            return _scan_directory_parallel(self.directory, self.num_workers)
+        return _iter_dicom_files(self.directory)
 
     def _get_single_dicom_info(self, filepath, tags, default_value=None):
         """
@@ -248,30 +593,69 @@ class DicomManager:
 
         Args:
             filepath (str): Path to the DICOM file to read.
-            tags (list): List of DICOM tags to extract.
+            tags (tuple): Pre-resolved numeric DICOM tags to extract.
 
         Returns:
-            dict: A dictionary containing the extracted metadata for the specified DICOM file. 
-                  Includes an 'error' key if an exception occurs or the file is invalid.
+            tuple: The extracted metadata values in `tags` order, with the file path
+                   appended last, or None if the file is invalid or unreadable.
         """
         try:
-            dicom_data = pydicom.dcmread(filepath, specific_tags=tags, stop_before_pixels=True)
+            if self._meta_tags_only:
+                # Every requested tag is in group 0x0002: stop after the file
+                # meta header instead of scanning the dataset body.
+                if not _has_dicm_magic(filepath):
+                    return None
+                dicom_data = pydicom.filereader.read_file_meta_info(filepath)
+            else:
+                # One buffered open serves both the magic-byte filter and the
+                # parse, instead of pydicom re-opening and issuing many small
+                # reads on the underlying file.
+                with open(filepath, "rb", buffering=1 << 20) as fp:
+                    preamble = fp.read(132)
+                    if len(preamble) < 132 or preamble[128:132] != b"DICM":
+                        return None
+                    fp.seek(0)
+                    dicom_data = pydicom.dcmread(fp, specific_tags=self._body_tag_ids, stop_before_pixels=True)
         except pydicom.errors.InvalidDicomError:
             return None
+        except OSError:
+            return None
         except Exception as e:
-            return {'error': str(e)}
+            logger.error(f"Failed to read {filepath}:\n => {e}")
+            return None
 
-        # Extract all tags from DICOM, including empty ones (None)
-        dicom_info = {}
+        # Extract all tags from DICOM, including empty ones (None). Probe the
+        # underlying tag dict directly for existence (one hash lookup, no
+        # KeyError construction for misses) and go through __getitem__ only for
+        # present tags, which still handles raw-element VR conversion. Group
+        # 0x0002 tags are resolved against the file meta header.
+        # Values are appended as pydicom returns them — most VRs already yield
+        # str, so no per-value str() pass is applied here.
+        file_meta = getattr(dicom_data, "file_meta", None)
+        raw = dicom_data._dict
+        meta_raw = file_meta._dict if file_meta is not None else None
+        getitem = dicom_data.__getitem__
+        values = []
+        append = values.append
         for tag in tags:
-            value = dicom_data.get(tag, default_value)
-            if isinstance(value, MultiValue):
-                dicom_info[tag] = " | ".join(map(str, value))
+            if tag in raw:
+                value = getitem(tag).value
+            elif meta_raw is not None and tag.group == 0x0002 and tag in meta_raw:
+                value = file_meta[tag].value
             else:
-                dicom_info[tag] = value
+                value = default_value
+            if isinstance(value, MultiValue):
+                value = " | ".join(map(str, value))
+            # DICOM archives repeat values massively (every file in a series
+            # shares its UIDs, PatientID, Modality, ...); interning collapses
+            # the copies to one object per unique value. pydicom's str
+            # subclasses (UID, PersonName reprs, ...) can't be interned.
+            if type(value) is str:
+                value = sys.intern(value)
+            append(value)
 
-        dicom_info["filename"] = filepath
-        return dicom_info
+        values.append(filepath)
+        return tuple(values)
 
     
     def _anonymize_single_dicom(self, dicom_path, clear_tags, output_directory, identifiers=None):
@@ -289,39 +673,8 @@ class DicomManager:
         Returns:
             str: Path to the anonymized DICOM file, or None if the process fails.
         """
-        try:
-            # Read the DICOM file
-            dicom_data = pydicom.dcmread(dicom_path)
-            
-            # Get the patient ID 
-            patient_id = dicom_data.PatientID
+        return _anonymize_single_dicom_task(dicom_path, clear_tags, output_directory, identifiers)
 
-            # Clear specified tags
-            for tag in clear_tags:
-                if tag in dicom_data:
-                    dicom_data[tag].value = ""
-            
-            # Anonymize the patient name and ID
-            if identifiers is not None:
-                if patient_id in identifiers:
-                    anonymized_id = identifiers[patient_id]
-                    dicom_data.PatientName = anonymized_id
-                    dicom_data.PatientID = anonymized_id 
-                else:
-                    raise KeyError(f"Patient ID '{patient_id}' not found in the provided identifiers.")
-             
-            # Determine the output file path
-            output_path = extract_format(os.path.join(output_directory, "$PatientID$/$StudyDate$/$SeriesDescription$"), dicom_data)
-            os.makedirs(output_path, exist_ok=True)
-                        
-            # Save the anonymized DICOM file
-            dicom_data.save_as(os.path.join(output_path, os.path.basename(dicom_path)))
-            
-            return output_path
-        except Exception as e:
-            logger.error(f"Failed to anonymize {dicom_path}:\n => {e}")
-            return None
-        
     
     def export_to_folder_structure(self, output_path, num_workers=None):
         """
@@ -512,10 +865,10 @@ def organize_dicom(input_dir, output_dir, groupby="SeriesInstanceUID", anonymize
     logger.info("Starting DICOM organization process...")
     manager = DicomManager(directory=input_dir, group_by=groupby, num_workers=num_workers)
     
-    # Apply filters
+    # Apply filters; validate_filters yields {column: compiled regex}, which
+    # filter evaluates as vectorized column masks instead of a row-wise callable
     if filters:
-        filter_by = create_dicommanager_filter(filters)
-        manager.filter(filter_by)
+        manager.filter(filters)
 
     # if scan mode is enabled, print the summary and exit
     if scan_mode:
@@ -546,6 +899,146 @@ def organize_dicom(input_dir, output_dir, groupby="SeriesInstanceUID", anonymize
     return results
 
 
+def _anonymize_dicom_batch(dicom_paths, clear_tags, output_directory, identifiers=None):
+    """
+    Anonymizes a batch of DICOM files (typically one source directory).
+
+    Args:
+        dicom_paths (list): Paths of the DICOM files to anonymize.
+        clear_tags (list): List of tags to clear.
+        output_directory (str): Directory to save the anonymized files.
+        identifiers (dict, optional): Patient ID to anonymized ID mapping.
+
+    Returns:
+        list: Output paths of the anonymized files; None entries mark failures.
+    """
+    results = []
+    errors = []
+    for path in dicom_paths:
+        try:
+            results.append(_anonymize_single_dicom_task(path, clear_tags, output_directory, identifiers))
+        except Exception as e:
+            results.append(None)
+            errors.append(f"{path}: {e}")
+
+    # One summary log per directory instead of a log call (and stdout lock)
+    # per failing file.
+    if errors:
+        logger.error(f"Failed to anonymize {len(errors)} file(s):\n => " + "\n => ".join(errors))
+
+    return results
+
+
+# Per-process cache of directories already created by the anonymize workers,
+# so repeated files in the same series cost no mkdir syscall.
+_created_dirs = set()
+
+
+def _anonymize_single_dicom_task(dicom_path, clear_tags, output_directory, identifiers=None):
+    """
+    Anonymizes a single DICOM file by clearing specified tags.
+
+    Module-level (rather than a bound method) so it pickles cheaply to worker
+    processes: the anonymization work is CPU-bound pydicom parsing, so it is
+    dispatched through a process pool rather than threads.
+
+    Args:
+        dicom_path (str): Path to the DICOM file to anonymize.
+        clear_tags (list): List of tags to clear.
+        output_directory (str): Directory to save the anonymized file.
+        identifiers (dict, optional): A dictionary mapping patient IDs (keys) to anonymized IDs (values).
+                                  If provided, the function replaces the PatientID and PatientName
+                                  in the DICOM file with the corresponding anonymized ID.
+
+    Returns:
+        str: Path to the anonymized DICOM file, or None if the file is not a
+             DICOM file. Unexpected errors propagate to the caller (the batch
+             wrapper aggregates them into one log entry per directory).
+    """
+    with open(dicom_path, "rb", buffering=1 << 20) as fp:
+        # Cheap precheck on the open handle: skip non-DICOM files without the
+        # cost of an exception and traceback per file.
+        preamble = fp.read(132)
+        if len(preamble) < 132 or preamble[128:132] != b"DICM":
+            return None
+        fp.seek(0)
+
+        # The cleared tags all live in the header, so parsing stops before the
+        # pixel data; the raw pixel bytes are copied through verbatim below,
+        # bypassing pixel decoding/re-encoding entirely.
+        try:
+            dicom_data = pydicom.dcmread(fp, stop_before_pixels=True)
+        except pydicom.errors.InvalidDicomError:
+            return None
+        # The raw-tail copy below assumes fp.tell() is a file offset into the
+        # original bytes. For deflated transfer syntaxes dcmread inflates the
+        # post-meta stream into a memory buffer, so that assumption breaks
+        # (the handle sits at EOF and the copy would silently write nothing);
+        # re-read the whole dataset and let save_as write it out instead.
+        transfer_syntax = getattr(dicom_data.file_meta, "TransferSyntaxUID", None)
+        if transfer_syntax is None or transfer_syntax.is_deflated:
+            fp.seek(0)
+            dicom_data = pydicom.dcmread(fp)
+            pixel_data_offset = None
+        else:
+            # dcmread rewinds to the start of the pixel data element on stop,
+            # so everything from here on is copied byte-for-byte.
+            pixel_data_offset = fp.tell()
+
+        # Get the patient ID
+        patient_id = dicom_data.PatientID
+
+        # Anonymize the patient name and ID
+        if identifiers is not None:
+            if patient_id in identifiers:
+                anonymized_id = identifiers[patient_id]
+                dicom_data.PatientName = anonymized_id
+                dicom_data.PatientID = anonymized_id
+            else:
+                raise KeyError(f"Patient ID '{patient_id}' not found in the provided identifiers.")
+
+        # Determine the output directory before clearing: the template may use
+        # tags (e.g. SeriesDescription) that are about to be blanked.
+        output_path = extract_format(os.path.join(output_directory, "$PatientID$/$StudyDate$/$SeriesDescription$"), dicom_data)
+
+        # Clear specified tags; a single get() replaces the contains + getitem
+        # double lookup. Tags are numeric (resolved in anonymize_dicom), so
+        # get() returns the DataElement directly.
+        for tag in clear_tags:
+            elem = dicom_data.get(tag)
+            if elem is not None:
+                elem.value = ""
+
+        if output_path not in _created_dirs:
+            os.makedirs(output_path, exist_ok=True)
+            _created_dirs.add(output_path)
+
+        # Save under a per-file unique name so concurrent workers never write
+        # to the same path; source basenames can collide across directories.
+        sop_uid = getattr(dicom_data, "SOPInstanceUID", None)
+        filename = f"{sop_uid}.dcm" if sop_uid else os.path.basename(dicom_path)
+        output_file = os.path.join(output_path, filename)
+
+        # Write the rewritten header, then stream the untouched remainder
+        # (pixel data onwards) straight from the source file.
+        try:
+            out = open(output_file, "wb")
+        except FileNotFoundError:
+            # The cached directory was removed externally (or the cache was
+            # inherited stale across a fork); recreate it and retry once.
+            _created_dirs.discard(output_path)
+            os.makedirs(output_path, exist_ok=True)
+            _created_dirs.add(output_path)
+            out = open(output_file, "wb")
+        with out:
+            dicom_data.save_as(out)
+            if pixel_data_offset is not None:
+                fp.seek(pixel_data_offset)
+                shutil.copyfileobj(fp, out)
+
+    return output_file
+
+
 def export_single_file(output_path, row):
     output_path = Path(output_path)
     try:
@@ -1,4 +1,5 @@
 import concurrent.futures
+import itertools
 import re
 from tqdm import tqdm
 import logging
@@ -7,109 +8,182 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-def parallel_tasks(function, arguments_list, num_workers=1, description="processing", show_bar=True, force_single_thread=False):
+def _apply_args(function, args):
     """
-    Executes a function in parallel using multiple worker processes.
-    
+    Unpacks a single argument tuple into `function`, returning None on failure.
+
+    Module-level so it stays picklable for process pools; exceptions are logged
+    instead of propagated so one bad task cannot abort a whole batch.
+    """
+    try:
+        return function(*args)
+    except Exception as e:
+        logger.info(f"Unable to get result for task {args}: {e}")
+        return None
+
+
+def parallel_tasks(function, arguments_list, num_workers=1, description="processing", show_bar=True, force_single_thread=False, chunksize=None, executor_cls=concurrent.futures.ProcessPoolExecutor, initializer=None, initargs=(), executor=None):
+    """
+    Executes a function in parallel using multiple worker processes or threads.
+
     Args:
         function (callable): The function to execute in parallel.
-        arguments_list (list): A list of argument tuples to pass to the function.
+        arguments_list (iterable): An iterable of argument tuples to pass to the function.
+            Generators are accepted, but executor.map consumes them fully on
+            submission, so bound the input (e.g. with itertools.islice) when
+            it can be very large.
         num_workers (int, optional): Number of workers to use for parallel execution. Defaults to 1.
         show_bar (bool, optional): Whether to display a progress bar using tqdm. Defaults to True.
         force_single_thread (bool, optional): Forces single-threaded execution, useful for debugging.
-    
+        chunksize (int, optional): Number of tasks batched per worker dispatch.
+            Defaults to roughly total/(4*num_workers) when the task count is known
+            (about four waves of work per worker), otherwise 32.
+        executor_cls (type, optional): Executor class to dispatch through. Defaults to
+            ProcessPoolExecutor for CPU-bound work; pass ThreadPoolExecutor for
+            I/O-bound tasks to avoid per-task pickling and process spawn cost.
+        initializer (callable, optional): Forwarded to the executor; runs once per
+            worker, useful for installing large invariant state so it isn't
+            serialized with every task.
+        initargs (tuple, optional): Arguments for `initializer`.
+        executor (concurrent.futures.Executor, optional): A caller-owned
+            executor to dispatch through instead of creating one per call,
+            amortizing worker startup across repeated calls. The caller keeps
+            ownership: it is not shut down here. When provided, executor_cls,
+            initializer and initargs are ignored.
+
     Returns:
         list: A list of results from the parallel execution, in the same order as the input argument list.
     """
-    force_single_thread = force_single_thread
     disabled = not show_bar
-    results_list = [None] * len(arguments_list)  # Preallocate the result list
-    total_tasks = len(arguments_list)
-    if num_workers is None:
+    total_tasks = len(arguments_list) if hasattr(arguments_list, "__len__") else None
+    if num_workers is not None and total_tasks is not None:
+        num_workers = min(total_tasks, num_workers or 1)
+    # With one (or no) worker there is nothing to parallelize: run inline and
+    # skip executor setup/teardown, which dwarfs the work for small batches.
+    if num_workers is None or num_workers <= 1:
         force_single_thread = True
-    else:
-        num_workers = min(len(arguments_list), num_workers or 1)
-    # Pool = concurrent.futures.ThreadPoolExecutor if os.name == 'nt' else concurrent.futures.ProcessPoolExecutor
-    Pool = concurrent.futures.ProcessPoolExecutor
+    if chunksize is None:
+        if total_tasks and num_workers:
+            chunksize = max(1, -(-total_tasks // (4 * num_workers)))  # ceil division
+        else:
+            chunksize = 32
+    Pool = executor_cls
 
-    with tqdm(total=total_tasks, desc=description, unit="item", disable=disabled) as pbar:
+    results_list = []
+    # Batch progress updates: pbar.update(1) per task takes the tqdm lock and
+    # can force a refresh for every completion, which adds up at 100k+ tasks.
+    update_stride = max(1, (total_tasks or 0) // 200)
+    pending_updates = 0
+    with tqdm(total=total_tasks, desc=description, unit="item", disable=disabled,
+              miniters=update_stride, mininterval=0.2, smoothing=0) as pbar:
         if not force_single_thread:
-            with Pool(max_workers=num_workers) as executor:
-                futures = {executor.submit(function, *args): idx for idx, args in enumerate(arguments_list)}
-                
-                for future in concurrent.futures.as_completed(futures):
-                    idx = futures[future]  # Get the index for the completed future
-                    try:
-                        results_list[idx] = future.result()  # Store the result at the correct index
-                    except Exception as e:
-                        logger.info(f"Unable to get result for task {idx}-{arguments_list[idx]}: {e}")
-                    
-                    pbar.update(1)
+            owns_executor = executor is None
+            if owns_executor:
+                executor = Pool(max_workers=num_workers, initializer=initializer, initargs=initargs)
+            try:
+                # executor.map preserves input order and batches `chunksize`
+                # tasks per IPC roundtrip. Note it submits eagerly: the whole
+                # iterable is consumed (and a future created per chunk) up
+                # front, so generators provide no backpressure here — callers
+                # with unbounded inputs must slice them first, as
+                # _get_dicom_info_parallel does with INFO_CHUNK_SIZE chunks.
+                for result in executor.map(_apply_args, itertools.repeat(function), arguments_list, chunksize=chunksize):
+                    results_list.append(result)
+                    pending_updates += 1
+                    if pending_updates >= update_stride:
+                        pbar.update(pending_updates)
+                        pending_updates = 0
+            finally:
+                if owns_executor:
+                    executor.shutdown()
         else:
-            for idx, args in enumerate(arguments_list):
-                try:
-                    results_list[idx] = function(*args)
-                except Exception as e:
-                    logger.info(f"Unable to get result for task {idx}-{arguments_list[idx]}: {e}")
-
-                pbar.update(1)
+            for args in arguments_list:
+                results_list.append(_apply_args(function, args))
+                pending_updates += 1
+                if pending_updates >= update_stride:
+                    pbar.update(pending_updates)
+                    pending_updates = 0
+        if pending_updates:
+            pbar.update(pending_updates)
 
     return results_list
 
 
-def replace_invalid_characters(filename):
-    invalid_characters = '<>:"/\|?*'
-    reserved_words = ['CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9', 'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9']
+# Characters invalid in Windows filenames, mapped to '_' in one C-level pass.
+_INVALID_CHARACTER_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+_RESERVED_WORDS = frozenset(['CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9', 'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'])
+
 
+def replace_invalid_characters(filename):
     # Replace invalid characters with an underscore
-    for char in invalid_characters:
-        filename = filename.replace(char, '_')
+    filename = filename.translate(_INVALID_CHARACTER_TABLE)
 
     # Check if filename is a reserved word
-    if filename.upper() in reserved_words:
+    if filename.upper() in _RESERVED_WORDS:
         filename += '_'
 
     # Remove leading and trailing periods and spaces
-    filename = filename.strip('.')
-    filename = filename.strip()
+    filename = filename.strip('. ')
 
     return filename
 
 
+# Compiled once; extract_format runs per exported/anonymized file.
+_PLACEHOLDER_RE = re.compile(r'\$([^$]+)\$')
+
+
 def extract_format(format_file, dict_format=None):
-        pattern = r'\$([^$]+)\$'
-        placeholders = re.findall(pattern, format_file)
-        
-        # Extract DICOM tag values
-        # tag_values = {placeholder: dict_format.get(placeholder, '') for placeholder in placeholders}
-        
-        # Replace placeholders in output_format with actual tag values
-        output_file = format_file
-        for placeholder in placeholders:
-            if '?' in placeholder:
-                conditional_tags = placeholder.split('?')
-                for ct in conditional_tags:
-                    value = dict_format.get(ct, None)
-                    if value is not None:
-                        break
-                
-
-            else:
-                value = dict_format.get(placeholder, None)
-            
-            
-            if value is None:
-                raise ValueError(f"Placeholder '{placeholder}' not found in dictionary. Pattern: {format_file}")
-            
-            if value == "":
-                raise ValueError(f"Placeholder '{placeholder}' has an empty value. Pattern: {format_file}")
-                
-            placeholder_str = f"${placeholder}$"
-            output_file = output_file.replace(placeholder_str, replace_invalid_characters(str(value)))
-            
-        
-        output_file = output_file.replace(" ", "_")
-        return output_file
+    """
+    Resolves `$Placeholder$` patterns in a format string against a dictionary
+    (or dict-like, e.g. a pydicom Dataset) in a single substitution pass.
+
+    Placeholders may contain fallbacks separated by '?', e.g.
+    `$StudyDate?AcquisitionDate$` uses the first key with a value.
+
+    Args:
+        format_file (str): Format string containing `$...$` placeholders.
+        dict_format (dict): Mapping used to resolve the placeholders.
+
+    Returns:
+        str: The resolved string with spaces replaced by underscores.
+
+    Raises:
+        ValueError: If a placeholder is missing from the dictionary or resolves
+                    to an empty value.
+    """
+    # Templates with no placeholders skip the substitution machinery entirely
+    if '$' not in format_file:
+        return format_file.replace(" ", "_")
+
+    # Repeated placeholders resolve once; sub() visits every occurrence
+    resolved = {}
+
+    def _replace(match):
+        placeholder = match.group(1)
+        cached = resolved.get(placeholder)
+        if cached is not None:
+            return cached
+        if '?' in placeholder:
+            value = None
+            for conditional_tag in placeholder.split('?'):
+                value = dict_format.get(conditional_tag, None)
+                if value is not None:
+                    break
+        else:
+            value = dict_format.get(placeholder, None)
+
+        if value is None:
+            raise ValueError(f"Placeholder '{placeholder}' not found in dictionary. Pattern: {format_file}")
+
+        if value == "":
+            raise ValueError(f"Placeholder '{placeholder}' has an empty value. Pattern: {format_file}")
+
+        result = replace_invalid_characters(str(value))
+        resolved[placeholder] = result
+        return result
+
+    output_file = _PLACEHOLDER_RE.sub(_replace, format_file)
+    return output_file.replace(" ", "_")
 
 def validate_filters(filters):
     """
@@ -0,0 +1,100 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pydicom
+from pydicom.dataset import Dataset, FileMetaDataset
+from pydicom.uid import (
+    DeflatedExplicitVRLittleEndian,
+    ExplicitVRLittleEndian,
+    ImplicitVRLittleEndian,
+    generate_uid,
+)
+
+from dicomorganizer import DicomManager
+
+PIXELS = np.arange(16 * 16, dtype=np.uint16).tobytes()
+
+
+def _make_dataset(transfer_syntax, patient_id="P1"):
+    """Builds a minimal MR dataset with known pixel bytes, fully in memory."""
+    sop_uid = generate_uid()
+    file_meta = FileMetaDataset()
+    file_meta.MediaStorageSOPClassUID = "1.2.840.10008.5.1.4.1.1.4"
+    file_meta.MediaStorageSOPInstanceUID = sop_uid
+    file_meta.TransferSyntaxUID = transfer_syntax
+
+    ds = Dataset()
+    ds.file_meta = file_meta
+    ds.SOPClassUID = file_meta.MediaStorageSOPClassUID
+    ds.SOPInstanceUID = sop_uid
+    ds.PatientID = patient_id
+    ds.PatientName = "Doe^John"
+    ds.PatientBirthDate = "19700101"
+    ds.InstitutionName = "Test Hospital"
+    ds.StudyDate = "20240101"
+    ds.SeriesDescription = "TEST_SERIES"
+    ds.Modality = "MR"
+    ds.Rows = 16
+    ds.Columns = 16
+    ds.BitsAllocated = 16
+    ds.BitsStored = 16
+    ds.HighBit = 15
+    ds.PixelRepresentation = 0
+    ds.SamplesPerPixel = 1
+    ds.PhotometricInterpretation = "MONOCHROME2"
+    ds.PixelData = PIXELS
+    return ds
+
+
+class TestAnonymizeRoundtrip(unittest.TestCase):
+    """Round-trips synthetic files through anonymize_dicom per transfer syntax."""
+
+    TRANSFER_SYNTAXES = {
+        "explicit": ExplicitVRLittleEndian,
+        "implicit": ImplicitVRLittleEndian,
+        "deflated": DeflatedExplicitVRLittleEndian,
+    }
+
+    def setUp(self):
+        self.input_directory = tempfile.mkdtemp()
+        self.output_directory = tempfile.mkdtemp()
+        for name, transfer_syntax in self.TRANSFER_SYNTAXES.items():
+            ds = _make_dataset(transfer_syntax)
+            ds.save_as(os.path.join(self.input_directory, f"{name}.dcm"), enforce_file_format=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.input_directory, ignore_errors=True)
+        shutil.rmtree(self.output_directory, ignore_errors=True)
+
+    def _anonymize(self, **kwargs):
+        manager = DicomManager(self.input_directory)
+        return manager.anonymize_dicom(
+            self.output_directory,
+            clear_tags=["PatientBirthDate", "InstitutionName"],
+            **kwargs,
+        )
+
+    def test_roundtrip_preserves_pixels_and_clears_tags(self):
+        anonymized_files = self._anonymize()
+        self.assertEqual(len(anonymized_files), len(self.TRANSFER_SYNTAXES))
+        for output_file in anonymized_files:
+            ds = pydicom.dcmread(output_file)
+            self.assertEqual(ds.PatientBirthDate, "")
+            self.assertEqual(ds.InstitutionName, "")
+            self.assertEqual(ds.PixelData, PIXELS)
+
+    def test_roundtrip_with_identifiers(self):
+        anonymized_files = self._anonymize(identifiers={"P1": "ANON001"})
+        self.assertEqual(len(anonymized_files), len(self.TRANSFER_SYNTAXES))
+        for output_file in anonymized_files:
+            ds = pydicom.dcmread(output_file)
+            self.assertEqual(ds.PatientID, "ANON001")
+            self.assertEqual(str(ds.PatientName), "ANON001")
+            self.assertEqual(ds.PixelData, PIXELS)
+
+
+if __name__ == "__main__":
+    unittest.main()